@@ -1,3 +1,3 @@
 # This file makes 'analyzer' a Python package
-from .text_utils import clean_text, count_characters
-from .word_counter import count_words_simple, count_words_advanced
\ No newline at end of file
+from .text_utils import clean_text, clean_texts, count_characters
+from .word_counter import count_words_simple, count_words_advanced, count_words_advanced_batch
\ No newline at end of file
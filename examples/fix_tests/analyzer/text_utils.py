@@ -1,17 +1,55 @@
-import re
+from functools import lru_cache
+
+def _keep(char: str) -> bool:
+    """True for characters the regex [^\\w\\s] would *not* match."""
+    return char.isalnum() or char.isspace() or char == '_'
+
+class _PunctTable(dict):
+    """Translation table for str.translate that drops anything the regex
+    [^\\w\\s] would match. Entries are filled in lazily per code point."""
+
+    def __missing__(self, key):
+        value = key if _keep(chr(key)) else None
+        self[key] = value
+        return value
+
+_PUNCT_TABLE = _PunctTable()
+
+# Lowercases and strips punctuation in one pass for ASCII input.
+_CLEAN_TABLE = {
+    i: ord(chr(i).lower()) if _keep(chr(i)) else None for i in range(128)
+}
 
 def clean_text(text: str) -> str:
     """Removes punctuation and converts text to lowercase."""
-    if not isinstance(text, str):
+    if type(text) is not str:
         raise TypeError("Input must be a string.")
-    text = text.lower()
-    text = re.sub(r'[^\w\s]', '', text) # Keep words and whitespace
-    return text
+    return _clean_text(text)
+
+def _clean_uncached(text: str) -> str:
+    """clean_text without the type check or the cache."""
+    if text.isascii():
+        return text.translate(_CLEAN_TABLE)
+    # str.lower() is context sensitive outside ASCII (e.g. final sigma),
+    # so it can't be folded into a per-character table.
+    return text.lower().translate(_PUNCT_TABLE) # Keep words and whitespace
+
+_clean_text = lru_cache(maxsize=1024)(_clean_uncached)
+
+def clean_texts(texts: list) -> list:
+    """Applies clean_text to every string in a list."""
+    cleaned = []
+    for text in texts:
+        if type(text) is not str:
+            raise TypeError("Input must be a string.")
+        # A corpus is mostly distinct documents, so bypass the cache.
+        cleaned.append(_clean_uncached(text))
+    return cleaned
 
 def count_characters(text: str, include_spaces: bool = True) -> int:
     """Counts characters in a string."""
-    if not isinstance(text, str):
+    if type(text) is not str:
         raise TypeError("Input must be a string.")
     if not include_spaces:
-        return len(text.replace(" ", ""))
+        return len(text) - text.count(" ")
     return len(text)
\ No newline at end of file
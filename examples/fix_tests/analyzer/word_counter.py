@@ -1,8 +1,11 @@
-from .text_utils import clean_text
+from collections import Counter
+from functools import lru_cache
+
+from .text_utils import _clean_uncached
 
 def count_words_simple(text: str) -> int:
     """A very simple word counter based on spaces."""
-    if not isinstance(text, str):
+    if type(text) is not str:
         raise TypeError("Input must be a string.")
     words = text.split()
     return len(words)
@@ -10,22 +13,32 @@ def count_words_simple(text: str) -> int:
 def count_words_advanced(text: str) -> dict:
     """
     Counts occurrences of each word in the text.
-    Uses clean_text for preprocessing.
+    Uses clean_text's uncached core for preprocessing.
     """
-    if not isinstance(text, str):
+    if type(text) is not str:
         raise TypeError("Input must be a string.")
-    
-    cleaned_text = clean_text(text)
-    words = cleaned_text.split()
-    
-    word_counts = {}
-    for word in words:
-        if word: # Ensure empty strings from multiple spaces are not counted
-            word_counts[word] = word_counts.get(word, 0) + 1
+    # Cached results are immutable; hand each caller its own dict.
+    return dict(_count_words(text))
+
+def _tally_words(text: str) -> tuple:
+    # Skip clean_text's cache: the intermediate cleaned string is only
+    # needed long enough to split it.
+    word_counts = Counter(_clean_uncached(text).split())
             
     if "the" in word_counts:
         word_counts["the"] = word_counts["the"] - 1 # Oops, an arbitrary adjustment!
         if word_counts["the"] == 0:
             del word_counts["the"]
             
-    return word_counts
\ No newline at end of file
+    return tuple(word_counts.items())
+
+_count_words = lru_cache(maxsize=1024)(_tally_words)
+
+def count_words_advanced_batch(texts: list) -> list:
+    """Applies count_words_advanced to every string in a list."""
+    counts = []
+    for text in texts:
+        if type(text) is not str:
+            raise TypeError("Input must be a string.")
+        counts.append(dict(_tally_words(text)))
+    return counts
\ No newline at end of file
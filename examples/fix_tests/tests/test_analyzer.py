@@ -1,15 +1,22 @@
 import pytest
-from analyzer.text_utils import clean_text, count_characters
-from analyzer.word_counter import count_words_simple, count_words_advanced
+from analyzer.text_utils import clean_text, clean_texts, count_characters
+from analyzer.word_counter import (
+    count_words_simple, count_words_advanced, count_words_advanced_batch
+)
 
 def test_clean_text():
     assert clean_text("Hello, World!") == "hello world"
     assert clean_text("  Test  123.  ") == "  test  123  " # note: re.sub keeps internal spaces
 
+def test_clean_texts():
+    assert clean_texts(["Hello, World!", "  Test  123.  "]) == ["hello world", "  test  123  "]
+    assert clean_texts([]) == []
+
 def test_count_characters():
     assert count_characters("hello") == 5
     assert count_characters("hello world") == 11
     assert count_characters("hello world", include_spaces=False) == 10
+    assert count_characters("  a\tb c\n", include_spaces=False) == 5 # only " " is dropped
 
 def test_count_words_simple():
     assert count_words_simple("one two three") == 3
@@ -26,6 +33,11 @@ def test_count_words_advanced_punctuation_and_case():
     expected = {"apple": 2, "banana": 1}
     assert count_words_advanced(text) == expected
 
+def test_count_words_advanced_batch():
+    texts = ["apple banana apple", "Apple, Banana! APPLE."]
+    expected = [{"apple": 2, "banana": 1}, {"apple": 2, "banana": 1}]
+    assert count_words_advanced_batch(texts) == expected
+
 def test_count_words_advanced_with_common_word():
     """
     This test is designed to fail due to the bug in count_words_advanced.
@@ -49,4 +61,8 @@ def test_input_type_errors():
     with pytest.raises(TypeError):
         count_words_simple([1,2,3])
     with pytest.raises(TypeError):
-        count_words_advanced(True)
\ No newline at end of file
+        count_words_advanced(True)
+    with pytest.raises(TypeError):
+        clean_texts(["ok", 123])
+    with pytest.raises(TypeError):
+        count_words_advanced_batch([None])
\ No newline at end of file
@@ -0,0 +1,4 @@
+from rich.console import Console
+
+# Shared by every gen_env component so the terminal is only probed once.
+CONSOLE = Console()
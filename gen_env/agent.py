@@ -1,11 +1,10 @@
 import json
-import re
 from typing import Any, Dict, List
 
 from openai import OpenAI
-from rich.console import Console
 from rich.panel import Panel
 
+from ._console import CONSOLE
 from .docker_manager import ExecResult
 
 DEFAULT_SYSTEM_PROMPT_TEMPLATE = """
@@ -40,6 +39,8 @@ The `finish` tool takes an optional `message` argument to describe your work.
 
 """
 
+PATCH_FILE_PREFIXES = ("*** Add File: ", "*** Update File: ", "*** Delete File: ")
+
 
 class GenEnvAgent:
     SHELL_TOOL_DEF = {
@@ -86,7 +87,7 @@ class GenEnvAgent:
     def __init__(self, model_name: str, client: OpenAI):
         self.model_name = model_name
         self.client = client
-        self.console = Console()
+        self.console = CONSOLE
 
     def initialize_conversation(self) -> List[Dict[str, Any]]:
         return [{"role": "system", "content": DEFAULT_SYSTEM_PROMPT_TEMPLATE}]
@@ -128,27 +129,31 @@ class GenEnvAgent:
             )
 
     def display_tool_output(self, result: ExecResult):
-        output_panel = ""
-        if result.stdout:
-            output_panel += f"[bold green]stdout:[/bold green]\n{result.stdout.strip()}"
-        if result.stderr:
-            output_panel += f"\n[bold red]stderr:[/bold red]\n{result.stderr.strip()}"
-
         title = f"Output (exit code: {result.exit_code})"
         border_color = "green" if result.exit_code == 0 else "red"
-        self.console.print(Panel(output_panel, title=title, border_style=border_color))
+        if not result.stdout and not result.stderr:
+            # Nothing to put in a panel; still report the exit code.
+            self.console.print(f"[{border_color}]{title}: no output[/{border_color}]")
+            return
+
+        parts = []
+        if result.stdout:
+            parts.append(f"[bold green]stdout:[/bold green]\n{result.stdout.strip()}")
+        if result.stderr:
+            parts.append(f"[bold red]stderr:[/bold red]\n{result.stderr.strip()}")
+        self.console.print(Panel("\n".join(parts), title=title, border_style=border_color))
 
     def _format_patch(self, patch_text):
-        file_match = re.search(r"\*\*\* (Add|Update|Delete) File: (.+)", patch_text)
-        title = (
-            f"Apply Patch to {file_match.group(2)}" if file_match else "Apply Patch"
-        )
-        content = ""
+        file_name = None
+        content = []
         for line in patch_text.splitlines():
             if line.startswith("+"):
-                content += f"[green]{line}[/green]\n"
+                content.append(f"[green]{line}[/green]\n")
             elif line.startswith("-"):
-                content += f"[red]{line}[/red]\n"
+                content.append(f"[red]{line}[/red]\n")
             else:
-                content += f"{line}\n"
-        self.console.print(Panel(content, title=title, border_style="magenta"))
\ No newline at end of file
+                if file_name is None and line.startswith(PATCH_FILE_PREFIXES):
+                    file_name = line.partition(" File: ")[2] or None
+                content.append(f"{line}\n")
+        title = f"Apply Patch to {file_name}" if file_name else "Apply Patch"
+        self.console.print(Panel("".join(content), title=title, border_style="magenta"))
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+import re
 import shlex
 import sys
 import atexit
@@ -7,12 +8,29 @@ from collections import namedtuple
 import docker
 from docker.errors import ImageNotFound, NotFound
 from docker.types import Mount
-from rich.console import Console
 
-console = Console()
+from ._console import CONSOLE as console
 
 ExecResult = namedtuple("ExecResult", ["stdout", "stderr", "exit_code"])
 
+_SH_PREFIX = ("/bin/sh", "-c")
+
+# Arguments made only of these characters mean the same thing with or
+# without a shell: no globbing, quoting, expansion or redirection.
+_SAFE_ARG_RE = re.compile(r"[\w\-./=:@]+")
+
+# Builtins and keywords that only exist inside a shell and so can't be
+# exec'd directly.
+_SHELL_BUILTINS = frozenset(
+    {
+        ".", ":", "alias", "bg", "case", "cd", "command", "eval", "exec",
+        "exit", "export", "fg", "for", "getopts", "hash", "if", "jobs",
+        "local", "read", "readonly", "return", "set", "shift", "source",
+        "times", "trap", "type", "ulimit", "umask", "unalias", "unset",
+        "until", "wait", "while",
+    }
+)
+
 
 class DockerManager:
     def __init__(
@@ -95,21 +113,45 @@ class DockerManager:
         # Agent provides it relative to the workspace root.
         workdir_abs = os.path.join('/workspace', workdir)
 
-        # Convert the command list to a single, shell-safe string.
-        # e.g., ['ls', '-l', 'my file'] -> "ls -l 'my file'"
-        command_str = " ".join(shlex.quote(part) for part in command)
-
-        # Wrap the command string in a shell invocation.
-        # This ensures we get authentic shell errors.
-        exec_command = ["/bin/sh", "-c", command_str]
-
-        result = self.container.exec_run(exec_command, workdir=workdir_abs, demux=True)
-
-        stdout = result.output[0].decode("utf-8", "ignore") if result.output[0] else ""
-        stderr = result.output[1].decode("utf-8", "ignore") if result.output[1] else ""
+        if (
+            command[0] not in _SHELL_BUILTINS
+            and "=" not in command[0]  # e.g. PYTHONPATH=. python ...
+            and all(_SAFE_ARG_RE.fullmatch(part) for part in command)
+        ):
+            # Plain argv with nothing for a shell to interpret: run it
+            # directly and save a fork+exec of /bin/sh. Note that a missing
+            # executable then surfaces as Docker's "OCI runtime exec failed"
+            # message on stdout rather than a shell error on stderr.
+            exec_command = command
+        else:
+            # Convert the command list to a single, shell-safe string.
+            # e.g., ['ls', '-l', 'my file'] -> "ls -l 'my file'"
+            command_str = " ".join(shlex.quote(part) for part in command)
+
+            # Wrap the command string in a shell invocation.
+            # This ensures we get authentic shell errors for these commands.
+            exec_command = [*_SH_PREFIX, command_str]
+
+        # Use the low-level API so the output can be streamed and the exit
+        # code looked up afterwards (exec_run(stream=True) drops the exec id).
+        exec_id = self.client.api.exec_create(
+            self.container.id, exec_command, workdir=workdir_abs
+        )["Id"]
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        for out_chunk, err_chunk in self.client.api.exec_start(
+            exec_id, stream=True, demux=True
+        ):
+            if out_chunk:
+                stdout_buf += out_chunk
+            if err_chunk:
+                stderr_buf += err_chunk
+        exit_code = self.client.api.exec_inspect(exec_id)["ExitCode"]
 
         return ExecResult(
-            stdout=stdout, stderr=stderr, exit_code=result.exit_code
+            stdout=stdout_buf.decode("utf-8", "ignore"),
+            stderr=stderr_buf.decode("utf-8", "ignore"),
+            exit_code=exit_code,
         )
 
     def stop_container(self):
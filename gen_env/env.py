@@ -1,16 +1,61 @@
 import json
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from openai import OpenAI
-from rich.console import Console
 
+from ._console import CONSOLE
 from .agent import GenEnvAgent
 from .docker_manager import DockerManager, ExecResult
-from .patch_utils import DiffError, process_patch
+from .patch_utils import Commit, DiffError, parse_patch, process_patch
 import subprocess
 
+try:
+    import orjson
+except ImportError:  # Optional speedup for serializing large tool outputs
+    orjson = None
+
+try:
+    import pygit2
+except ImportError:  # Optional: run git in-process instead of spawning `git`
+    pygit2 = None
+
+_GIT_ERRORS: Tuple[type, ...] = (subprocess.CalledProcessError, FileNotFoundError)
+if pygit2 is not None:
+    _GIT_ERRORS += (pygit2.GitError,)
+
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+@lru_cache(maxsize=32)
+def _parse_patch_cached(
+    text: str, orig: Tuple[Tuple[str, str], ...]
+) -> Union[Commit, DiffError]:
+    try:
+        return parse_patch(text, dict(orig))
+    except DiffError as e:
+        return e.with_traceback(None)
+
+
+def _parse_patch(text: str, orig: Dict[str, str]) -> Commit:
+    """Memoized patch_utils.parse_patch.
+
+    Parsing is a pure function of the patch text and the files it touches,
+    so an agent re-sending the same patch against unchanged files (typically
+    after it was rejected) reuses the earlier result, including the error.
+    """
+    result = _parse_patch_cached(text, tuple(orig.items()))
+    if isinstance(result, DiffError):
+        raise DiffError(str(result))
+    return result
+
+
 @dataclass
 class Step:
     thought: Optional[str] = None
@@ -24,24 +69,78 @@ class GenEnv:
         self.max_steps = max_steps
         self.docker_manager = DockerManager()
         self.agent = GenEnvAgent(model_name, client)
-        self.console = Console()
+        self.console = CONSOLE
         self.project_path = None
+        # Contents of workspace files as last read or written by apply_patch,
+        # keyed by normalized absolute path so that "a.txt" and "./a.txt"
+        # share one entry. Cleared whenever a shell command runs, since that
+        # may change files behind our back.
+        self._file_cache: Dict[str, str] = {}
+
+    def _init_git_repo(self) -> None:
+        """Initializes a git repo in the project path with all files committed."""
+        if pygit2 is not None:
+            repo = pygit2.init_repository(self.project_path)
+            repo.config["user.name"] = "Agent"
+            repo.config["user.email"] = "agent@example.com"
+            index = repo.index
+            index.add_all()
+            index.write()
+            sig = pygit2.Signature("Agent", "agent@example.com")
+            parents = [] if repo.head_is_unborn else [repo.head.target]
+            repo.create_commit(
+                "HEAD", sig, sig, "Initial commit", index.write_tree(), parents
+            )
+            return
+
+        # 1. Initialize the repository FIRST
+        subprocess.run(["git", "init"], cwd=self.project_path, check=True, capture_output=True)
+
+        # 2. Now, set the local config for the newly created repo
+        git_config_user = ["git", "config", "user.name", "Agent"]
+        git_config_email = ["git", "config", "user.email", "agent@example.com"]
+        subprocess.run(git_config_user, cwd=self.project_path, check=True, capture_output=True)
+        subprocess.run(git_config_email, cwd=self.project_path, check=True, capture_output=True)
+
+        # 3. Add all files and make an initial commit to serve as a baseline
+        subprocess.run(["git", "add", "."], cwd=self.project_path, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Initial commit", "--no-verify"], cwd=self.project_path, check=True, capture_output=True)
 
     def _generate_git_patch(self) -> str:
         """Generates a git diff patch for the changes in the project path."""
         if not self.project_path:
             return ""
         try:
-            # It is a git repo, get the diff from the initial state
-            result = subprocess.run(
+            if pygit2 is not None:
+                # Equivalent of `git diff HEAD`: HEAD -> index, then
+                # index -> working tree, so files staged in the container
+                # are included just like with the git CLI.
+                repo = pygit2.Repository(self.project_path)
+                try:
+                    head = repo.revparse_single("HEAD")
+                except KeyError as e:  # HEAD doesn't resolve to a commit
+                    raise pygit2.GitError(f"Cannot resolve HEAD: {e}") from e
+                head_tree = head.peel(pygit2.Tree)
+                diff = head_tree.diff_to_index(repo.index)
+                diff.merge(repo.index.diff_to_workdir())
+                return diff.patch or ""
+
+            # It is a git repo, get the diff from the initial state.
+            # Read it in chunks and decode once rather than letting
+            # subprocess hold both the raw and decoded output.
+            with subprocess.Popen(
                 ["git", "diff", "HEAD"],
                 cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout
-        except (subprocess.CalledProcessError, FileNotFoundError):
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            ) as proc:
+                buf = bytearray()
+                for chunk in iter(lambda: proc.stdout.read(65536), b""):
+                    buf += chunk
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
+            return buf.decode("utf-8", "ignore")
+        except _GIT_ERRORS:
             self.console.print(
                 "[yellow]Warning: Could not generate git diff. Was the git repository initialized correctly?[/yellow]"
             )
@@ -57,52 +156,58 @@ class GenEnv:
         if command[0] == "apply_patch":
             if len(command) > 1 and isinstance(command[1], str):
                 patch_text = command[1]
+                # project_path is absolute and normalized; normpath on the
+                # joined path folds "./a.txt", "d/../a.txt" etc. together.
+                prefix = self.project_path + os.sep
+                made_dirs = set()
                 try:
                     def open_fn(p):
-                        with open(os.path.join(self.project_path, p), "rt") as f:
-                            return f.read()
+                        path_full = os.path.normpath(prefix + p)
+                        if path_full not in self._file_cache:
+                            with open(path_full, "rt") as f:
+                                self._file_cache[path_full] = f.read()
+                        return self._file_cache[path_full]
                     def write_fn(p, c):
-                        path_full = os.path.join(self.project_path, p)
-                        os.makedirs(os.path.dirname(path_full), exist_ok=True)
+                        path_full = os.path.normpath(prefix + p)
+                        dir_name = os.path.dirname(path_full)
+                        if dir_name not in made_dirs:
+                            os.makedirs(dir_name, exist_ok=True)
+                            made_dirs.add(dir_name)
                         with open(path_full, "wt") as f:
                             f.write(c)
+                        self._file_cache[path_full] = c
                     def remove_fn(p):
-                        os.unlink(os.path.join(self.project_path, p))
+                        path_full = os.path.normpath(prefix + p)
+                        self._file_cache.pop(path_full, None)
+                        os.unlink(path_full)
 
                     if not patch_text.strip().startswith("*** Begin Patch"):
                         patch_text = "*** Begin Patch\n" + patch_text
                     if not patch_text.strip().endswith("*** End Patch"):
                         patch_text = patch_text + "\n*** End Patch"
 
-                    result = process_patch(patch_text, open_fn, write_fn, remove_fn)
+                    result = process_patch(
+                        patch_text, open_fn, write_fn, remove_fn, parse_fn=_parse_patch
+                    )
                     return ExecResult(stdout=result, stderr="", exit_code=0)
                 except (DiffError, FileNotFoundError) as e:
                     return ExecResult(stdout="", stderr=str(e), exit_code=1)
             else:
                 return ExecResult("", "'apply_patch' requires a patch string.", 1)
         else:
+            self._file_cache.clear()
             return self.docker_manager.execute_command(command, workdir_relative)
 
     def run_episode(
         self, project_path: str, prompt: str
     ) -> Tuple[List[Step], Optional[str]]:
         self.project_path = os.path.abspath(project_path)
+        self._file_cache.clear()
         # --- Initialize Git repo to track changes from the start ---
         try:
-            # 1. Initialize the repository FIRST
-            subprocess.run(["git", "init"], cwd=self.project_path, check=True, capture_output=True)
-
-            # 2. Now, set the local config for the newly created repo
-            git_config_user = ["git", "config", "user.name", "Agent"]
-            git_config_email = ["git", "config", "user.email", "agent@example.com"]
-            subprocess.run(git_config_user, cwd=self.project_path, check=True, capture_output=True)
-            subprocess.run(git_config_email, cwd=self.project_path, check=True, capture_output=True)
-
-            # 3. Add all files and make an initial commit to serve as a baseline
-            subprocess.run(["git", "add", "."], cwd=self.project_path, check=True, capture_output=True)
-            subprocess.run(["git", "commit", "-m", "Initial commit", "--no-verify"], cwd=self.project_path, check=True, capture_output=True)
+            self._init_git_repo()
             self.console.print("[green]Initialized git repository to track changes.[/green]")
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        except _GIT_ERRORS as e:
             print(e)
             self.console.print("[yellow]Warning: Failed to initialize git repository. Final patch generation via `finish` tool will be unavailable.[/yellow]")
 
@@ -139,7 +244,7 @@ class GenEnv:
                         if tool_name == "shell":
                             exec_result = self._execute_tool_call(tool_args)
 
-                            tool_output_json = json.dumps(exec_result._asdict())
+                            tool_output_json = _dumps(exec_result._asdict())
                             step.tool_output = exec_result._asdict()
                             self.agent.display_tool_output(exec_result)
 
@@ -164,7 +269,7 @@ class GenEnv:
                                 "role": "tool",
                                 "tool_call_id": tool_call.id,
                                 "name": tool_name,
-                                "content": json.dumps({"error": error_msg}),
+                                "content": _dumps({"error": error_msg}),
                             }
                         )
                         self.console.print(f"[red]Error:[/red] {error_msg}")
@@ -426,6 +426,11 @@ def text_to_patch(text: str, orig: Dict[str, str]) -> Tuple[Patch, int]:
     return parser.patch, parser.fuzz
 
 
+def parse_patch(text: str, orig: Dict[str, str]) -> Commit:
+    patch, _fuzz = text_to_patch(text, orig)
+    return patch_to_commit(patch, orig)
+
+
 def identify_files_needed(text: str) -> List[str]:
     lines = text.splitlines()
     return [
@@ -481,13 +486,13 @@ def process_patch(
     open_fn: Callable[[str], str],
     write_fn: Callable[[str, str], None],
     remove_fn: Callable[[str], None],
+    parse_fn: Callable[[str, Dict[str, str]], Commit] = parse_patch,
 ) -> str:
     if not text.startswith("*** Begin Patch"):
         raise DiffError("Patch text must start with *** Begin Patch")
     paths = identify_files_needed(text)
     orig = load_files(paths, open_fn)
-    patch, _fuzz = text_to_patch(text, orig)
-    commit = patch_to_commit(patch, orig)
+    commit = parse_fn(text, orig)
     apply_commit(commit, write_fn, remove_fn)
     return "Done!"
 